@@ -2,10 +2,18 @@ import json
 import re
 from copy import deepcopy
 
+import pyarrow as pa
 import pyarrow.parquet as pq
 from fsspec.implementations.local import LocalFileSystem
 from fsspec.spec import AbstractFileSystem
+from pyarrow.dataset import FileSystemDataset
 from pyarrow.dataset import dataset as pyarrow_dataset
+from pyarrow.dataset import field
+
+from deltalake.schema import schema_from_string
+
+# Name of the column used to tell row groups apart while prefiltering
+_ROW_GROUP_TAG = "__delta_row_group"
 
 
 class DeltaTable:
@@ -31,8 +39,11 @@ class DeltaTable:
         self.version = 0
         self.checkpoint = 0
         self.files = set()
-        self._latest_file = ""
-        self._latest_file_time = 0
+        self._protocol = None
+        self._metadata = None
+        # Parsed log state per version, shared with copies made by `as_version`,
+        # so the same version is never replayed twice.
+        self._log_cache = {}
         if file_system is None:
             file_system = LocalFileSystem()
         self.filesystem = file_system
@@ -42,23 +53,91 @@ class DeltaTable:
         # which makes it hard to inherit from it directly.
         # Instead we will just have the dataset as an attribute and expose the important methods.
         self.pyarrow_dataset = self._pyarrow_dataset()
+        self._cache_state()
 
     def _pyarrow_dataset(self):
-        # Use the latest file to fetch the schema.
+        # Use the schema from the latest metaData action in the log,
+        # instead of reading it from the parquet files.
         # This will allow for schema evolution
-        schema = pyarrow_dataset(
-            source=self._latest_file,
+        schema = schema_from_string(
+            self._metadata["schemaString"], infer_type=self._infer_type
+        )
+
+        return pyarrow_dataset(
+            source=list(self.files),
             filesystem=self.filesystem,
             partitioning="hive",
             format="parquet",
-        ).schema
+            schema=schema,
+        )
 
-        return pyarrow_dataset(
+    def _infer_type(self, name):
+        # Only for types that can't be converted from the log,
+        # take the type pyarrow reads from the first file that has the column
+        dataset = pyarrow_dataset(
             source=list(self.files),
             filesystem=self.filesystem,
             partitioning="hive",
             format="parquet",
-            schema=schema,
+        )
+        if name in dataset.schema.names:
+            return dataset.schema.field(name).type
+        for fragment in dataset.get_fragments():
+            if name in fragment.physical_schema.names:
+                return fragment.physical_schema.field(name).type
+        return pa.null()
+
+    def _prefiltered_dataset(self, filter):
+        dataset = self.pyarrow_dataset
+        # Skip the files in partitions, and the row groups with statistics,
+        # that can't match the filter
+        row_groups = [
+            (fragment, row_group.id)
+            for fragment in dataset.get_fragments(filter=filter)
+            for row_group_fragment in fragment.split_by_row_group(
+                filter=filter, schema=dataset.schema
+            )
+            for row_group in row_group_fragment.row_groups
+        ]
+
+        # Tag the rows of each row group with its index, as if it was a partition,
+        # so one threaded scan of the filter columns finds the row groups with matches
+        tagged_row_groups = [
+            dataset.format.make_fragment(
+                fragment.path,
+                dataset.filesystem,
+                fragment.partition_expression & (field(_ROW_GROUP_TAG) == i),
+                row_groups=[row_group_id],
+            )
+            for i, (fragment, row_group_id) in enumerate(row_groups)
+        ]
+        matches = FileSystemDataset(
+            tagged_row_groups,
+            dataset.schema.append(pa.field(_ROW_GROUP_TAG, pa.int64())),
+            dataset.format,
+            filesystem=dataset.filesystem,
+        ).to_table(columns=[_ROW_GROUP_TAG], filter=filter)
+        matching = set(matches.column(_ROW_GROUP_TAG).to_pylist())
+
+        # Keep one fragment per file with the matching row groups,
+        # so each file is only opened once when the data is read
+        matching_row_groups = {}
+        for i, (fragment, row_group_id) in enumerate(row_groups):
+            if i in matching:
+                matching_row_groups.setdefault(fragment.path, (fragment, []))
+                matching_row_groups[fragment.path][1].append(row_group_id)
+        fragments = [
+            dataset.format.make_fragment(
+                fragment.path,
+                dataset.filesystem,
+                fragment.partition_expression,
+                row_groups=row_group_ids,
+            )
+            for fragment, row_group_ids in matching_row_groups.values()
+        ]
+
+        return FileSystemDataset(
+            fragments, dataset.schema, dataset.format, filesystem=dataset.filesystem
         )
 
     @property
@@ -70,15 +149,66 @@ class DeltaTable:
 
     def _reset_state(self):
         self.files = set()
-        self._latest_file = ""
-        self._latest_file_time = 0
+        self._protocol = None
+        self._metadata = None
+
+    def _cache_state(self):
+        self._log_cache[self.version] = (
+            self.checkpoint,
+            frozenset(self.files),
+            self._protocol,
+            self._metadata,
+            self.pyarrow_dataset,
+        )
 
-    def _apply_from_checkpoint(self, checkpoint_version: int):
+    def _load_version(self, version: int):
+        if version in self._log_cache:
+            (
+                self.checkpoint,
+                files,
+                self._protocol,
+                self._metadata,
+                self.pyarrow_dataset,
+            ) = self._log_cache[version]
+            self.files = set(files)
+            self.version = version
+            return
+
+        self._replay(checkpoint_version=version // 10 * 10, version=version)
+        self.pyarrow_dataset = self._pyarrow_dataset()
+        # Only cache versions that actually exist in the log
+        if self.version == version:
+            self._cache_state()
 
-        # reset file set, and checkpoint version
+    def _replay(self, checkpoint_version: int, version: int):
+        # Replay the checkpoint and the following logs in a single pass,
+        # collecting the protocol, metadata and files from the same reads
         self._reset_state()
         self.checkpoint = checkpoint_version
-
+        log_files = self._log_files(version=version)
+        self._apply_from_checkpoint()
+        self._apply_partial_logs(log_files)
+
+    def _apply_action(self, action: dict):
+        # The log contains other stuff, but we are only
+        # interested in the protocol, metaData, add or remove entries
+        if action.get("protocol"):
+            self._protocol = action["protocol"]
+
+        if action.get("metaData"):
+            self._metadata = action["metaData"]
+
+        if action.get("add"):
+            self.files.add(f"{self.path}/{action['add']['path']}")
+
+        if action.get("remove"):
+            # To handle 0 checkpoints, we might read the log file with
+            # same version as checkpoint. this means that we try to
+            # remove a file that belongs to an ealier version,
+            # which we don't have in the list
+            self.files.discard(f"{self.path}/{action['remove']['path']}")
+
+    def _apply_from_checkpoint(self):
         if self.checkpoint == 0:
             return
 
@@ -88,19 +218,16 @@ class DeltaTable:
         ) as checkpoint_file:
             checkpoint = pq.read_table(checkpoint_file).to_pandas()
 
-            for i, row in checkpoint.iterrows():
-                if not row["add"]:
-                    continue
-                added_file = f"{self.path}/{row['add']['path']}"
-                if added_file:
-                    self.files.add(added_file)
+        # Each row of the checkpoint holds a single action
+        for action in checkpoint.to_dict("records"):
+            self._apply_action(action)
 
-                modificationTime = row["add"]["modificationTime"]
-                if modificationTime > self._latest_file_time:
-                    self._latest_file = added_file
-                    self._latest_file_time = modificationTime
+    @staticmethod
+    def _log_version(log_file: str):
+        # Get version from log name
+        return int(re.findall(r"(\d{20})", log_file)[0])
 
-    def _apply_partial_logs(self, version: int):
+    def _log_files(self, version: int):
         # Checkpoints are created every 10 transactions,
         # so we need to find all log files with version
         # up to 9 higher than checkpoint.
@@ -110,63 +237,59 @@ class DeltaTable:
         log_files = self.filesystem.glob(
             f"{self.log_path}/{self.checkpoint//10:019}*.json"
         )
-        # sort the log files, so we are sure we get the correct order
-        log_files = sorted(log_files)
+        # sort the log files, so we are sure we get the correct order.
+        # Stop at the desired version
+        return [
+            log_file
+            for log_file in sorted(log_files)
+            if self._log_version(log_file) <= version
+        ]
+
+    def _apply_partial_logs(self, log_files):
         for log_file in log_files:
-
-            # Get version from log name
-            log_version = re.findall(r"(\d{20})", log_file)[0]
-            self.version = int(log_version)
+            self.version = self._log_version(log_file)
 
             # Download log file
             with self.filesystem.open(log_file) as log:
                 for line in log:
-                    meta_data = json.loads(line)
-                    # Log contains other stuff, but we are only
-                    # interested in the add or remove entries
-                    if "add" in meta_data.keys():
-                        file = f"{self.path}/{meta_data['add']['path']}"
-                        self.files.add(file)
-
-                        self._latest_file_time = meta_data["add"]["modificationTime"]
-                        self._latest_file = file
-
-                    if "remove" in meta_data.keys():
-                        remove_file = f"{self.path}/{meta_data['remove']['path']}"
-                        # To handle 0 checkpoints, we might read the log file with
-                        # same version as checkpoint. this means that we try to
-                        # remove a file that belongs to an ealier version,
-                        # which we don't have in the list
-                        if remove_file in self.files:
-                            self.files.remove(remove_file)
-                # Stop if we have reatched the desired version
-                if self.version == version:
-                    break
+                    self._apply_action(json.loads(line))
 
     def _as_newest_version(self):
+        checkpoint_version = 0
         # Try to get the latest checkpoint info
         try:
             # get latest checkpoint version
             with self.filesystem.open(f"{self.log_path}/_last_checkpoint") as lst_check:
                 checkpoint_info = lst_check.read()
-            checkpoint_info = json.loads(checkpoint_info)
-            self._apply_from_checkpoint(checkpoint_info["version"])
+            checkpoint_version = json.loads(checkpoint_info)["version"]
 
         except FileNotFoundError:
             pass
 
         # apply remaining versions. This can be a maximum of 9 versions.
         # we will just break when we don't find any newer logs
-        self._apply_partial_logs(version=self.checkpoint + 9)
+        self._replay(
+            checkpoint_version=checkpoint_version, version=checkpoint_version + 9
+        )
 
-    def to_table(self, *args, **kwargs):
+    def to_table(self, *args, prefilter=False, **kwargs):
         """
         Convert to a pyarrow Table.
         Is based on the `to_pandas` function from `pyarrow.Table.to_pandas`,
         so any this will accept the same arguments.
+        If a `filter` is given, pyarrow skips files in partitions that can't match it,
+        and the row groups whose statistics can't match it.
+        With `prefilter=True`, the filter columns are read first, and row groups
+        without any matching rows are skipped before the remaining columns are read.
+        This opens each row group once more, so it only pays off when the filter
+        matches few row groups and the remaining columns are large.
         For more information see https://arrow.apache.org/docs/python/generated/pyarrow.dataset.FileSystemDataset.html#pyarrow.dataset.FileSystemDataset.to_table
         """  # noqa E501
-        return self.pyarrow_dataset.to_table(*args, **kwargs)
+        filter = kwargs.get("filter")
+        if not prefilter or filter is None:
+            return self.pyarrow_dataset.to_table(*args, **kwargs)
+
+        return self._prefiltered_dataset(filter).to_table(*args, **kwargs)
 
     def to_pandas(self, *args, **kwargs):
         """
@@ -196,16 +319,18 @@ class DeltaTable:
         dr : (DeltaTable)
             Delta table that has parsed the log files for the specific version
         """
-        nearest_checkpoint = version // 10 * 10
         if inplace:
-            self._apply_from_checkpoint(nearest_checkpoint)
-            self._apply_partial_logs(version=version)
-            self.pyarrow_dataset = self._pyarrow_dataset()
+            self._load_version(version)
             return self
 
-        deltaTable = deepcopy(self)
-        deltaTable._apply_from_checkpoint(nearest_checkpoint)
-        deltaTable._apply_partial_logs(version=version)
-        deltaTable.pyarrow_dataset = deltaTable._pyarrow_dataset()
+        # Share the caches and dataset with the copy, instead of copying them
+        deltaTable = deepcopy(
+            self,
+            {
+                id(self._log_cache): self._log_cache,
+                id(self.pyarrow_dataset): self.pyarrow_dataset,
+            },
+        )
+        deltaTable._load_version(version)
 
         return deltaTable
@@ -0,0 +1,96 @@
+import json
+import re
+
+import pyarrow as pa
+
+_PRIMITIVE_TYPES = {
+    "string": pa.string(),
+    "long": pa.int64(),
+    "integer": pa.int32(),
+    "short": pa.int16(),
+    "byte": pa.int8(),
+    "float": pa.float32(),
+    "double": pa.float64(),
+    "boolean": pa.bool_(),
+    "binary": pa.binary(),
+    "date": pa.date32(),
+    # Delta timestamps have microsecond precision. Spark's INT96 timestamps are
+    # read as nanoseconds, but are microsecond exact, so they are cast without loss
+    "timestamp": pa.timestamp("us"),
+    "timestamp_ntz": pa.timestamp("us"),
+    "void": pa.null(),
+}
+
+_DECIMAL_TYPE = re.compile(r"decimal\((\d+),\s*(\d+)\)")
+
+
+def _to_pyarrow_type(delta_type):
+    if isinstance(delta_type, dict):
+        if delta_type["type"] == "struct":
+            fields = [_to_pyarrow_field(field) for field in delta_type["fields"]]
+            return pa.struct(fields)
+        if delta_type["type"] == "array":
+            element = pa.field(
+                "element",
+                _to_pyarrow_type(delta_type["elementType"]),
+                nullable=delta_type["containsNull"],
+            )
+            return pa.list_(element)
+        if delta_type["type"] == "map":
+            return pa.map_(
+                _to_pyarrow_type(delta_type["keyType"]),
+                _to_pyarrow_type(delta_type["valueType"]),
+            )
+        raise TypeError(f"Unsupported Delta type: {delta_type['type']}")
+
+    if delta_type in _PRIMITIVE_TYPES:
+        return _PRIMITIVE_TYPES[delta_type]
+
+    decimal = _DECIMAL_TYPE.fullmatch(delta_type)
+    if decimal:
+        return pa.decimal128(int(decimal.group(1)), int(decimal.group(2)))
+
+    raise TypeError(f"Unsupported Delta type: {delta_type}")
+
+
+def _to_pyarrow_field(delta_field):
+    return pa.field(
+        delta_field["name"],
+        _to_pyarrow_type(delta_field["type"]),
+        nullable=delta_field["nullable"],
+    )
+
+
+def schema_from_string(schema_string: str, infer_type=None):
+    """
+    Convert the `schemaString` of a Delta `metaData` action to a pyarrow schema.
+
+    Parameters:
+    ----------
+    schema_string: str
+        Spark StructType serialized as JSON, as stored in the Delta log
+    infer_type: callable, optional
+        Called with the name of a top level column whose Delta type can't be converted,
+        returns the pyarrow type to use for it instead. If not given, a TypeError is raised
+
+    Returns:
+    -------
+    schema : (pyarrow.Schema)
+        The table schema, including partition columns
+    """
+    delta_schema = json.loads(schema_string)
+    fields = []
+    for delta_field in delta_schema["fields"]:
+        try:
+            fields.append(_to_pyarrow_field(delta_field))
+        except TypeError:
+            if infer_type is None:
+                raise
+            fields.append(
+                pa.field(
+                    delta_field["name"],
+                    infer_type(delta_field["name"]),
+                    nullable=delta_field["nullable"],
+                )
+            )
+    return pa.schema(fields)
@@ -1,25 +1,83 @@
+import atexit
+import hashlib
+import inspect
 import os
 import shutil
 import uuid
+from datetime import datetime, timedelta, timezone
 from unittest import TestCase
 
 import pyarrow.dataset as ds
 import pyspark
 from gcsfs import GCSFileSystem
-from pandas.testing import assert_frame_equal
-from pyspark.sql.functions import col, rand, when
+from pandas.util import hash_pandas_object
+from pyspark import StorageLevel
+from pyspark.sql.functions import col, lit, rand, when
 
 from deltalake import DeltaTable
 
 GCP_BUCKET = os.getenv("GCP_BUCKET")
 GCP_PROJECT_ID = os.getenv("GCP_PROJECT_ID")
+# Fixtures that are not used anymore are removed once they are this old
+_FIXTURE_MAX_AGE = timedelta(days=30)
+
+
+def _frame_hash(df, decimals=10):
+    # Reduce a dataframe to its column names and a single hash of its content.
+    # Rows are sorted by id and columns by name, since neither order is guaranteed,
+    # and floats are rounded to ignore floating point noise
+    columns = sorted(df.columns)
+    content = df.sort_values("id")[columns].round(decimals)
+    return columns, hash_pandas_object(content, index=False).sum()
+
+
+def _expected_hashes(spark, path, versions):
+    # Read all versions of the table with Spark in a single job,
+    # using a column to tell the versions apart
+    frames = {}
+    for version in versions:
+        reader = spark.read.format("delta")
+        if version is not None:
+            reader = reader.option("versionAsOf", version)
+        frames[version] = reader.load(path)
+
+    # Versions may have different schemas, so missing columns are padded with nulls
+    types = {
+        field.name: field.dataType
+        for frame in frames.values()
+        for field in frame.schema.fields
+    }
+    union = None
+    for i, frame in enumerate(frames.values()):
+        padded = frame.select(
+            *[
+                (
+                    col(name)
+                    if name in frame.columns
+                    else lit(None).cast(data_type).alias(name)
+                )
+                for name, data_type in types.items()
+            ],
+            lit(i).alias("_version"),
+        )
+        union = padded if union is None else union.unionByName(padded)
 
+    df_spark = union.toPandas()
+    return {
+        version: _frame_hash(df_spark[df_spark["_version"] == i][frame.columns])
+        for i, (version, frame) in enumerate(frames.items())
+    }
 
-class DeltaReaderAppendTest(TestCase):
-    @classmethod
-    def setUpClass(self):
-        self.path = f"tests/{str(uuid.uuid4())}/table1"
-        self.spark = (
+
+_spark = None
+
+
+def _get_spark():
+    # Starting Spark and resolving the Delta jars is slow,
+    # so all test classes share one session, which is stopped at exit
+    global _spark
+    if _spark is None:
+        _spark = (
             pyspark.sql.SparkSession.builder.appName("deltalake")
             .config("spark.jars.packages", "io.delta:delta-core_2.12:0.7.0")
             .config("spark.sql.extensions", "io.delta.sql.DeltaSparkSessionExtension")
@@ -27,308 +85,361 @@ class DeltaReaderAppendTest(TestCase):
                 "spark.sql.catalog.spark_catalog",
                 "org.apache.spark.sql.delta.catalog.DeltaCatalog",
             )
+            # Use Arrow to transfer data from Spark to pandas in toPandas()
+            .config("spark.sql.execution.arrow.pyspark.enabled", "true")
+            .config("spark.sql.execution.arrow.maxRecordsPerBatch", "10000")
             .getOrCreate()
         )
+        atexit.register(_spark.stop)
+    return _spark
+
+
+def _fixture(fs, create_table, local_path):
+    # Fixtures are stored in GCS under the hash of the code that creates them and
+    # the Spark setup, so the table is only built and uploaded when those change
+    source = inspect.getsource(create_table) + inspect.getsource(_get_spark)
+    fixture_hash = hashlib.sha256((source + pyspark.__version__).encode()).hexdigest()
+    fixture_path = f"{GCP_BUCKET}/_fixtures/{fixture_hash}"
+    latest_path = f"{fixture_path}/_LATEST"
+    try:
+        remote_path = fs.cat(latest_path).decode()
+    except FileNotFoundError:
+        remote_path = None
+
+    if remote_path is not None:
+        # Spark needs a local copy of the table, to compute the expected data
+        fs.get(remote_path, local_path, recursive=True)
+        return remote_path
+
+    # Start from an empty folder, in case an earlier attempt left files behind
+    shutil.rmtree(local_path, ignore_errors=True)
+    create_table(local_path)
+    remote_path = f"{fixture_path}/{str(uuid.uuid4())}/table1"
+    try:
+        # gcsfs already uploads the files of a recursive put concurrently
+        fs.put(local_path, remote_path, recursive=True)
+    except Exception:
+        # Remove the partial upload, only this run knows it will never be completed
+        upload_path = remote_path.rsplit("/", 1)[0]
+        if fs.exists(upload_path):
+            fs.rm(upload_path, recursive=True)
+        raise
+    # Only point to the fixture once it is completely uploaded,
+    # so other test runs never see a partial table
+    fs.pipe(latest_path, remote_path.encode())
+
+    _remove_stale_fixtures(fs)
+    return remote_path
+
+
+def _is_stale(fs, path):
+    # Objects in GCS are never modified, so a path is stale
+    # when the newest object under it was written long enough ago
+    now = datetime.now(timezone.utc)
+    updated = [
+        datetime.fromisoformat(info["updated"].replace("Z", "+00:00"))
+        for info in fs.find(path, detail=True).values()
+        if info.get("updated")
+    ]
+    return bool(updated) and now - max(updated) > _FIXTURE_MAX_AGE
+
+
+def _remove_stale_fixtures(fs):
+    # Concurrent test runs may still be uploading or downloading other fixtures,
+    # so only fixtures that nothing was written to for a while are removed.
+    # The fixtures that a _LATEST pointer refers to are kept, unless the pointer
+    # itself is stale, like the fixtures of an old version of the code
+    fixtures_path = f"{GCP_BUCKET}/_fixtures"
+    fs.invalidate_cache(fixtures_path)
+    for hash_path in fs.ls(fixtures_path, detail=False):
+        latest_path = f"{hash_path}/_LATEST"
+        latest_fixture = None
+        if fs.exists(latest_path):
+            if _is_stale(fs, hash_path):
+                # Remove the pointer first, so it never refers to a partial table
+                fs.rm(latest_path)
+                fs.rm(hash_path, recursive=True)
+                continue
+            latest_fixture = fs.cat(latest_path).decode().rsplit("/", 1)[0]
+
+        keep = {fs._strip_protocol(latest_path)}
+        if latest_fixture is not None:
+            keep.add(fs._strip_protocol(latest_fixture))
+        for path in fs.ls(hash_path, detail=False):
+            if fs._strip_protocol(path) not in keep and _is_stale(fs, path):
+                fs.rm(path, recursive=True)
+
+
+class DeltaReaderAppendTest(TestCase):
+    @classmethod
+    def _create_table(self, path):
+        # The tests rely on one Delta commit per append (checkpoint at 10, time travel),
+        # so the appends are kept, but each commit only writes one file per partition
         df = (
-            self.spark.range(0, 1000)
+            self.spark.range(0, 1000, numPartitions=1)
             .withColumn("number", rand())
             .withColumn("number2", when(col("id") < 500, 0).otherwise(1))
         )
+        # Materialize the random numbers once, instead of once per append
+        base_df = df.persist(StorageLevel.MEMORY_AND_DISK)
+        base_df.count()
 
         for i in range(12):
-            df.withColumn("id", col("id") + 1000 * i).write.partitionBy(
+            base_df.withColumn("id", col("id") + 1000 * i).write.partitionBy(
                 "number2"
-            ).format("delta").mode("append").save(self.path)
-        self.fs = GCSFileSystem(project=GCP_PROJECT_ID)
+            ).format("delta").mode("append").save(path)
+
+        base_df.unpersist()
 
-        self.fs.upload(self.path, f"{GCP_BUCKET}/{self.path}", recursive=True)
-        self.table = DeltaTable(f"{GCP_BUCKET}/{self.path}", file_system=self.fs)
+    @classmethod
+    def setUpClass(self):
+        self.path = f"tests/{str(uuid.uuid4())}/table1"
+        self.spark = _get_spark()
+        self.fs = GCSFileSystem(project=GCP_PROJECT_ID)
+        self.remote_path = _fixture(self.fs, self._create_table, self.path)
+        self.table = DeltaTable(self.remote_path, file_system=self.fs)
+        # Tests that don't depend on GCS read the local copy of the table
+        self.local_table = DeltaTable(self.path)
+        self.expected_hashes = _expected_hashes(self.spark, self.path, [None, 5, 11])
 
     @classmethod
     def tearDownClass(self):
-        # remove folder when we are done with the test
-        self.fs.rm(f"{GCP_BUCKET}/{self.path}", recursive=True)
+        # remove the local folder when we are done with the test.
+        # The fixture in GCS is kept, so it can be reused by later test runs
         shutil.rmtree(self.path)
 
     def test_paths(self):
-        assert self.table.path == f"{GCP_BUCKET}/{self.path}"
-        assert self.table.log_path == f"{GCP_BUCKET}/{self.path}/_delta_log"
+        # the log and the data files are found in GCS, under the uploaded fixture
+        assert self.fs.exists(f"{self.table.log_path}/{0:020}.json")
+        assert self.table.files
+        for path in self.table.files:
+            assert path.startswith(f"{self.remote_path}/")
+            assert self.fs.exists(path)
 
     def test_versions(self):
 
-        assert self.table.checkpoint == 10
-        assert self.table.version == 11
+        assert self.local_table.checkpoint == 10
+        assert self.local_table.version == 11
 
     def test_data(self):
 
         # read the parquet files using pandas
         df_pandas = self.table.to_pandas()
-        # read the table using spark
-        df_spark = self.spark.read.format("delta").load(self.path).toPandas()
 
-        # compare dataframes. The index may not be the same order, so we ignore it
-        assert_frame_equal(
-            df_pandas.set_index("id"), df_spark.set_index("id"), check_like=True
-        )
+        # compare with the table read by spark. The row and column order may differ
+        assert _frame_hash(df_pandas) == self.expected_hashes[None]
 
     def test_version_no_checkpoint(self):
         # read the parquet files using pandas
         df_pandas = self.table.as_version(5, inplace=False).to_pandas()
-        # read the table using spark
-        df_spark = (
-            self.spark.read.format("delta")
-            .option("versionAsOf", 5)
-            .load(self.path)
-            .toPandas()
-        )
 
-        # compare dataframes. The index may not be the same order, so we ignore it
-        assert_frame_equal(
-            df_pandas.set_index("id"), df_spark.set_index("id"), check_like=True
-        )
+        # compare with the table read by spark. The row and column order may differ
+        assert _frame_hash(df_pandas) == self.expected_hashes[5]
 
     def test_version_checkpoint(self):
         # read the parquet files using pandas
         df_pandas = self.table.as_version(11, inplace=False).to_pandas()
-        # read the table using spark
-        df_spark = (
-            self.spark.read.format("delta")
-            .option("versionAsOf", 11)
-            .load(self.path)
-            .toPandas()
-        )
 
-        # compare dataframes. The index may not be the same order, so we ignore it
-        assert_frame_equal(
-            df_pandas.set_index("id"), df_spark.set_index("id"), check_like=True
-        )
+        # compare with the table read by spark. The row and column order may differ
+        assert _frame_hash(df_pandas) == self.expected_hashes[11]
 
     def test_partitioning(self):
         # Partition pruning should half number of rows
-        assert self.table.to_table(filter=ds.field("number2") == 0).num_rows == 6000
+        t = self.local_table.to_table(filter=ds.field("number2") == 0)
+        assert t.num_rows == 6000
 
     def test_predicate_pushdown(self):
         # number is random 0-1, so we should have fewer than 12000 rows no matter what
-        assert self.table.to_table(filter=ds.field("number") < 0.5).num_rows < 12000
+        t = self.local_table.to_table(filter=ds.field("number") < 0.5)
+        assert t.num_rows < 12000
 
     def test_column_pruning(self):
-        t = self.table.to_table(columns=["number", "number2"])
+        t = self.local_table.to_table(columns=["number", "number2"])
         assert t.column_names == ["number", "number2"]
 
 
 class DeltaReaderUpdateTest(TestCase):
     @classmethod
-    def setUpClass(self):
-        self.path = f"tests/{str(uuid.uuid4())}/table1"
-        self.spark = (
-            pyspark.sql.SparkSession.builder.appName("deltalake")
-            .config("spark.jars.packages", "io.delta:delta-core_2.12:0.7.0")
-            .config("spark.sql.extensions", "io.delta.sql.DeltaSparkSessionExtension")
-            .config(
-                "spark.sql.catalog.spark_catalog",
-                "org.apache.spark.sql.delta.catalog.DeltaCatalog",
-            )
-            .getOrCreate()
-        )
+    def _create_table(self, path):
+        # The tests rely on one Delta commit per append (checkpoint at 10, time travel),
+        # so the appends are kept, but each commit only writes one file per partition
         df = (
-            self.spark.range(0, 1000)
+            self.spark.range(0, 1000, numPartitions=1)
             .withColumn("number", rand())
             .withColumn("number2", when(col("id") < 500, 0).otherwise(1))
         )
+        # Materialize the random numbers once, instead of once per append
+        base_df = df.persist(StorageLevel.MEMORY_AND_DISK)
+        base_df.count()
 
         for i in range(12):
-            df.withColumn("id", col("id") + 1000 * i).write.partitionBy(
+            base_df.withColumn("id", col("id") + 1000 * i).write.partitionBy(
                 "number2"
-            ).format("delta").mode("append").save(self.path)
+            ).format("delta").mode("append").save(path)
         # Create a temp view of table, so we can update it
-        self.spark.read.format("delta").load(self.path).createOrReplaceTempView(
-            "table1"
-        )
+        self.spark.read.format("delta").load(path).createOrReplaceTempView("table1")
         self.spark.sql("UPDATE table1 set number=123 where id='0'")
-        self.fs = GCSFileSystem(project=GCP_PROJECT_ID)
 
-        self.fs.upload(self.path, f"{GCP_BUCKET}/{self.path}", recursive=True)
-        self.table = DeltaTable(f"{GCP_BUCKET}/{self.path}", file_system=self.fs)
+        base_df.unpersist()
+
+    @classmethod
+    def setUpClass(self):
+        self.path = f"tests/{str(uuid.uuid4())}/table1"
+        self.spark = _get_spark()
+        self.fs = GCSFileSystem(project=GCP_PROJECT_ID)
+        self.remote_path = _fixture(self.fs, self._create_table, self.path)
+        self.table = DeltaTable(self.remote_path, file_system=self.fs)
+        # Tests that don't depend on GCS read the local copy of the table
+        self.local_table = DeltaTable(self.path)
+        self.expected_hashes = _expected_hashes(self.spark, self.path, [None, 5, 11])
 
     @classmethod
     def tearDownClass(self):
-        # remove folder when we are done with the test
-        self.fs.rm(f"{GCP_BUCKET}/{self.path}", recursive=True)
+        # remove the local folder when we are done with the test.
+        # The fixture in GCS is kept, so it can be reused by later test runs
         shutil.rmtree(self.path)
 
     def test_paths(self):
-        assert self.table.path == f"{GCP_BUCKET}/{self.path}"
-        assert self.table.log_path == f"{GCP_BUCKET}/{self.path}/_delta_log"
+        # the log and the data files are found in GCS, under the uploaded fixture
+        assert self.fs.exists(f"{self.table.log_path}/{0:020}.json")
+        assert self.table.files
+        for path in self.table.files:
+            assert path.startswith(f"{self.remote_path}/")
+            assert self.fs.exists(path)
 
     def test_versions(self):
 
-        assert self.table.checkpoint == 10
-        assert self.table.version == 12
+        assert self.local_table.checkpoint == 10
+        assert self.local_table.version == 12
 
     def test_data(self):
 
         # read the parquet files using pandas
         df_pandas = self.table.to_pandas()
-        # read the table using spark
-        df_spark = self.spark.read.format("delta").load(self.path).toPandas()
 
-        # compare dataframes. The index may not be the same order, so we ignore it
-        assert_frame_equal(
-            df_pandas.set_index("id"), df_spark.set_index("id"), check_like=True
-        )
+        # compare with the table read by spark. The row and column order may differ
+        assert _frame_hash(df_pandas) == self.expected_hashes[None]
 
     def test_version_no_checkpoint(self):
         # read the parquet files using pandas
         df_pandas = self.table.as_version(5, inplace=False).to_pandas()
-        # read the table using spark
-        df_spark = (
-            self.spark.read.format("delta")
-            .option("versionAsOf", 5)
-            .load(self.path)
-            .toPandas()
-        )
 
-        # compare dataframes. The index may not be the same order, so we ignore it
-        assert_frame_equal(
-            df_pandas.set_index("id"), df_spark.set_index("id"), check_like=True
-        )
+        # compare with the table read by spark. The row and column order may differ
+        assert _frame_hash(df_pandas) == self.expected_hashes[5]
 
     def test_version_checkpoint(self):
         # read the parquet files using pandas
         df_pandas = self.table.as_version(11, inplace=False).to_pandas()
-        # read the table using spark
-        df_spark = (
-            self.spark.read.format("delta")
-            .option("versionAsOf", 11)
-            .load(self.path)
-            .toPandas()
-        )
 
-        # compare dataframes. The index may not be the same order, so we ignore it
-        assert_frame_equal(
-            df_pandas.set_index("id"), df_spark.set_index("id"), check_like=True
-        )
+        # compare with the table read by spark. The row and column order may differ
+        assert _frame_hash(df_pandas) == self.expected_hashes[11]
 
     def test_partitioning(self):
         # Partition pruning should half number of rows
-        assert self.table.to_table(filter=ds.field("number2") == 0).num_rows == 6000
+        t = self.local_table.to_table(filter=ds.field("number2") == 0)
+        assert t.num_rows == 6000
 
     def test_predicate_pushdown(self):
         # number is random 0-1, so we should have fewer than 12000 rows no matter what
-        assert self.table.to_table(filter=ds.field("number") < 0.5).num_rows < 12000
+        t = self.local_table.to_table(filter=ds.field("number") < 0.5)
+        assert t.num_rows < 12000
 
     def test_column_pruning(self):
-        t = self.table.to_table(columns=["number", "number2"])
+        t = self.local_table.to_table(columns=["number", "number2"])
         assert t.column_names == ["number", "number2"]
 
 
 class DeltaReaderSchemaEvolutionTest(TestCase):
     @classmethod
-    def setUpClass(self):
-        self.path = f"tests/{str(uuid.uuid4())}/table1"
-        self.spark = (
-            pyspark.sql.SparkSession.builder.appName("deltalake")
-            .config("spark.jars.packages", "io.delta:delta-core_2.12:0.7.0")
-            .config("spark.sql.extensions", "io.delta.sql.DeltaSparkSessionExtension")
-            .config(
-                "spark.sql.catalog.spark_catalog",
-                "org.apache.spark.sql.delta.catalog.DeltaCatalog",
-            )
-            .getOrCreate()
-        )
-
+    def _create_table(self, path):
+        # The tests rely on one Delta commit per append (checkpoint at 10, time travel),
+        # so the appends are kept, but each commit only writes one file per partition
         df = (
-            self.spark.range(0, 1000)
+            self.spark.range(0, 1000, numPartitions=1)
             .withColumn("number", rand())
             .withColumn("number2", when(col("id") < 500, 0).otherwise(1))
         )
+        # Materialize the random numbers once, instead of once per append
+        base_df = df.persist(StorageLevel.MEMORY_AND_DISK)
+        base_df.count()
 
         for i in range(5):
-            df.withColumn("id", col("id") + 1000 * i).write.partitionBy(
+            base_df.withColumn("id", col("id") + 1000 * i).write.partitionBy(
                 "number2"
-            ).format("delta").mode("append").save(self.path)
+            ).format("delta").mode("append").save(path)
 
         # Add data with one more column, using schema evolution
-        df = df.withColumn("number3", rand())
+        df = base_df.withColumn("number3", rand())
         for i in range(5):
             df.withColumn("id", col("id") + 1000 * (i + 5)).write.partitionBy(
                 "number2"
-            ).option("mergeSchema", "true").format("delta").mode("append").save(
-                self.path
-            )
+            ).option("mergeSchema", "true").format("delta").mode("append").save(path)
 
         # Add data with one more column, using schema evolution
         df = df.withColumn("number4", rand())
         for i in range(5):
             df.withColumn("id", col("id") + 1000 * (i + 10)).write.partitionBy(
                 "number2"
-            ).option("mergeSchema", "true").format("delta").mode("append").save(
-                self.path
-            )
+            ).option("mergeSchema", "true").format("delta").mode("append").save(path)
 
-        self.fs = GCSFileSystem(project=GCP_PROJECT_ID)
+        base_df.unpersist()
 
-        self.fs.upload(self.path, f"{GCP_BUCKET}/{self.path}", recursive=True)
-        self.table = DeltaTable(f"{GCP_BUCKET}/{self.path}", file_system=self.fs)
+    @classmethod
+    def setUpClass(self):
+        self.path = f"tests/{str(uuid.uuid4())}/table1"
+        self.spark = _get_spark()
+        self.fs = GCSFileSystem(project=GCP_PROJECT_ID)
+        self.remote_path = _fixture(self.fs, self._create_table, self.path)
+        self.table = DeltaTable(self.remote_path, file_system=self.fs)
+        # Tests that don't depend on GCS read the local copy of the table
+        self.local_table = DeltaTable(self.path)
+        self.expected_hashes = _expected_hashes(self.spark, self.path, [None, 5, 11])
 
     @classmethod
     def tearDownClass(self):
-        # remove folder when we are done with the test
-        self.fs.rm(f"{GCP_BUCKET}/{self.path}", recursive=True)
+        # remove the local folder when we are done with the test.
+        # The fixture in GCS is kept, so it can be reused by later test runs
         shutil.rmtree(self.path)
 
     def test_data(self):
 
         # read the parquet files using pandas
         df_pandas = self.table.to_pandas()
-        # read the table using spark
-        df_spark = self.spark.read.format("delta").load(self.path).toPandas()
 
-        # compare dataframes. The index may not be the same order, so we ignore it
-        assert_frame_equal(
-            df_pandas.set_index("id"), df_spark.set_index("id"), check_like=True
-        )
+        # compare with the table read by spark. The row and column order may differ
+        assert _frame_hash(df_pandas) == self.expected_hashes[None]
 
     def test_version_no_checkpoint(self):
         # read the parquet files using pandas
         df_pandas = self.table.as_version(5, inplace=False).to_pandas()
-        # read the table using spark
-        df_spark = (
-            self.spark.read.format("delta")
-            .option("versionAsOf", 5)
-            .load(self.path)
-            .toPandas()
-        )
 
-        # compare dataframes. The index may not be the same order, so we ignore it
-        assert_frame_equal(
-            df_pandas.set_index("id"), df_spark.set_index("id"), check_like=True
-        )
+        # compare with the table read by spark. The row and column order may differ
+        assert _frame_hash(df_pandas) == self.expected_hashes[5]
 
     def test_version_checkpoint(self):
         # read the parquet files using pandas
         df_pandas = self.table.as_version(11, inplace=False).to_pandas()
-        # read the table using spark
-        df_spark = (
-            self.spark.read.format("delta")
-            .option("versionAsOf", 11)
-            .load(self.path)
-            .toPandas()
-        )
 
-        # compare dataframes. The index may not be the same order, so we ignore it
-        assert_frame_equal(
-            df_pandas.set_index("id"), df_spark.set_index("id"), check_like=True
-        )
+        # compare with the table read by spark. The row and column order may differ
+        assert _frame_hash(df_pandas) == self.expected_hashes[11]
+
+    def test_schema(self):
+        # the schema is read from the delta log, and follows the version of the table
+        latest_columns = ["id", "number", "number2", "number3", "number4"]
+        assert self.table.schema.names == latest_columns
+        version_4_columns = ["id", "number", "number2"]
+        assert self.table.as_version(4, inplace=False).schema.names == version_4_columns
 
     def test_partitioning(self):
         # Partition pruning should half number of rows
-        assert self.table.to_table(filter=ds.field("number2") == 0).num_rows == 7500
+        t = self.local_table.to_table(filter=ds.field("number2") == 0)
+        assert t.num_rows == 7500
 
     def test_predicate_pushdown(self):
         # number is random 0-1, so we should have fewer than 12000 rows no matter what
-        assert self.table.to_table(filter=ds.field("number") < 0.5).num_rows < 12000
+        t = self.local_table.to_table(filter=ds.field("number") < 0.5)
+        assert t.num_rows < 12000
 
     def test_column_pruning(self):
-        t = self.table.to_table(columns=["number", "number2"])
+        t = self.local_table.to_table(columns=["number", "number2"])
         assert t.column_names == ["number", "number2"]
@@ -4,6 +4,7 @@ from unittest import TestCase
 
 import pyarrow.dataset as ds
 import pyspark
+from fsspec.implementations.local import LocalFileSystem
 from pandas.testing import assert_frame_equal
 from pyspark.sql.functions import col, rand, when
 
@@ -14,6 +15,19 @@ def test_version():
     assert __version__ == "0.2.5"
 
 
+class CountingFileSystem(LocalFileSystem):
+    # Local filesystem that records the files that are opened
+    cachable = False
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.opened = []
+
+    def open(self, path, *args, **kwargs):
+        self.opened.append(path)
+        return super().open(path, *args, **kwargs)
+
+
 class DeltaReaderAppendTest(TestCase):
     @classmethod
     def setUpClass(self):
@@ -100,6 +114,43 @@ class DeltaReaderAppendTest(TestCase):
             df_pandas.set_index("id"), df_spark.set_index("id"), check_like=True
         )
 
+    def test_version_cache(self):
+        filesystem = CountingFileSystem()
+        table = DeltaTable(self.path, file_system=filesystem)
+        table.as_version(5)
+        filesystem.opened.clear()
+        # both versions have been loaded before, so no log files should be read
+        table.as_version(11)
+        table.as_version(5)
+        assert filesystem.opened == []
+        assert table.version == 5
+
+    def test_prefilter(self):
+        # the ids are integers, so no row has 10 < id < 11, but the statistics
+        # of the row group with ids around 10 can't rule it out
+        filter = ((ds.field("id") > 10) & (ds.field("id") < 11)) | (
+            ds.field("id") == 500
+        )
+        dataset = self.table.pyarrow_dataset
+        row_groups = [
+            row_group
+            for fragment in dataset.get_fragments(filter=filter)
+            for row_group in fragment.split_by_row_group(
+                filter=filter, schema=dataset.schema
+            )
+        ]
+        assert len(row_groups) > 1
+        # only the file with id 500 is kept, with just the row group that has it
+        fragments = list(self.table._prefiltered_dataset(filter).get_fragments())
+        assert len(fragments) == 1
+        assert len(fragments[0].row_groups) == 1
+
+        # skipping row groups without matches should not change the result
+        df = self.table.to_table(filter=filter).to_pandas()
+        df_prefiltered = self.table.to_table(filter=filter, prefilter=True).to_pandas()
+        assert df["id"].tolist() == [500]
+        assert_frame_equal(df_prefiltered, df)
+
     def test_partitioning(self):
         # Partition pruning should half number of rows
         assert self.table.to_table(filter=ds.field("number2") == 0).num_rows == 6000
@@ -310,6 +361,13 @@ class DeltaReaderSchemaEvolutionTest(TestCase):
             df_pandas.set_index("id"), df_spark.set_index("id"), check_like=True
         )
 
+    def test_schema(self):
+        # the schema is read from the delta log, and follows the version of the table
+        latest_columns = ["id", "number", "number2", "number3", "number4"]
+        assert self.table.schema.names == latest_columns
+        version_4_columns = ["id", "number", "number2"]
+        assert self.table.as_version(4, inplace=False).schema.names == version_4_columns
+
     def test_partitioning(self):
         # Partition pruning should half number of rows
         assert self.table.to_table(filter=ds.field("number2") == 0).num_rows == 7500
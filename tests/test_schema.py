@@ -0,0 +1,69 @@
+import json
+
+import pyarrow as pa
+import pytest
+
+from deltalake.schema import schema_from_string
+
+
+def _schema_string(*fields):
+    return json.dumps(
+        {
+            "type": "struct",
+            "fields": [
+                {"name": name, "type": delta_type, "nullable": True, "metadata": {}}
+                for name, delta_type in fields
+            ],
+        }
+    )
+
+
+def test_primitive_types():
+    schema = schema_from_string(
+        _schema_string(
+            ("id", "long"),
+            ("price", "decimal(10,2)"),
+            ("ts", "timestamp"),
+            ("ts_ntz", "timestamp_ntz"),
+            ("empty", "void"),
+        )
+    )
+    assert schema.field("id").type == pa.int64()
+    assert schema.field("price").type == pa.decimal128(10, 2)
+    assert schema.field("ts").type == pa.timestamp("us")
+    assert schema.field("ts_ntz").type == pa.timestamp("us")
+    assert schema.field("empty").type == pa.null()
+
+
+def test_nested_types():
+    struct = {
+        "type": "struct",
+        "fields": [{"name": "a", "type": "integer", "nullable": False, "metadata": {}}],
+    }
+    array = {"type": "array", "elementType": "string", "containsNull": False}
+    map_type = {
+        "type": "map",
+        "keyType": "string",
+        "valueType": "double",
+        "valueContainsNull": True,
+    }
+    schema = schema_from_string(
+        _schema_string(("s", struct), ("arr", array), ("m", map_type))
+    )
+    assert schema.field("s").type == pa.struct(
+        [pa.field("a", pa.int32(), nullable=False)]
+    )
+    assert schema.field("arr").type == pa.list_(
+        pa.field("element", pa.string(), nullable=False)
+    )
+    assert schema.field("m").type == pa.map_(pa.string(), pa.float64())
+
+
+def test_unknown_type():
+    schema_string = _schema_string(("id", "long"), ("geo", "geometry"))
+    with pytest.raises(TypeError):
+        schema_from_string(schema_string)
+
+    schema = schema_from_string(schema_string, infer_type=lambda name: pa.binary())
+    assert schema.field("id").type == pa.int64()
+    assert schema.field("geo").type == pa.binary()